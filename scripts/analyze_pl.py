@@ -17,11 +17,23 @@ from __future__ import annotations
 import shutil
 import sys
 import os
+from bisect import bisect_right
+from collections import Counter, defaultdict
+from dataclasses import dataclass
+from functools import lru_cache
+from types import MappingProxyType
 
 from openpyxl import load_workbook
-from openpyxl.styles import Font, Alignment, PatternFill, Border, Side
+from openpyxl.styles import Font, Alignment, PatternFill, Border, Side, NamedStyle
+from openpyxl.cell import Cell
 from openpyxl.utils import get_column_letter
 
+try:
+    # Optional: Rust-backed reader, much faster than openpyxl for the input P&L
+    from python_calamine import CalamineWorkbook
+except ImportError:
+    CalamineWorkbook = None
+
 # Add scripts dir to path for cost_model import
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 from cost_model import (
@@ -30,6 +42,7 @@ from cost_model import (
     get_employee_role_mapping,
     get_savings_summary,
     CURRENT_FA_OPEX,
+    SALARY_BAND_THRESHOLDS,
 )
 
 
@@ -59,6 +72,43 @@ _THIN_BORDER = Border(
     bottom=Side(style="thin", color="B4C6E7"),
 )
 _WRAP = Alignment(wrap_text=True, vertical="top")
+_HIGHLIGHT_FILL = PatternFill(start_color="FFF2CC", end_color="FFF2CC", fill_type="solid")
+_OVER_FONT = Font(name="Arial", size=9, color="CC0000", bold=True)
+_UNDER_FONT = Font(name="Arial", size=9, color="008000")
+_FINDING_FONT = Font(name="Arial", size=9, color="CC0000")
+_SAVINGS_FONT = Font(name="Arial", size=10, bold=True, color="008000")
+
+# Named styles registered once per output workbook. Cells take a single
+# `cell.style = name` assignment instead of separate font / fill /
+# number_format / alignment assignments. Values: (font, fill, number_format, alignment)
+_NAMED_STYLES = {
+    "PL Header":             (_HEADER_FONT, _HEADER_FILL, None, _WRAP),
+    "PL Data":               (_DATA_FONT, None, None, None),
+    "PL Data Currency":      (_DATA_FONT, None, _CURRENCY_FMT, None),
+    "PL Data Pct":           (_DATA_FONT, None, _PCT_FMT, None),
+    "PL Bold":               (_BOLD_FONT, None, None, None),
+    "PL Bold Currency":      (_BOLD_FONT, None, _CURRENCY_FMT, None),
+    "PL Bold Pct":           (_BOLD_FONT, None, _PCT_FMT, None),
+    "PL Total":              (_BOLD_FONT, _TOTAL_FILL, None, None),
+    "PL Total Currency":     (_BOLD_FONT, _TOTAL_FILL, _CURRENCY_FMT, None),
+    "PL Total Pct":          (_BOLD_FONT, _TOTAL_FILL, _PCT_FMT, None),
+    "PL Highlight":          (_BOLD_FONT, _HIGHLIGHT_FILL, None, None),
+    "PL Highlight Currency": (_BOLD_FONT, _HIGHLIGHT_FILL, _CURRENCY_FMT, None),
+    "PL Highlight Pct":      (_BOLD_FONT, _HIGHLIGHT_FILL, _PCT_FMT, None),
+    "PL Note":               (_DATA_FONT, None, None, _WRAP),
+    "PL Over":               (_OVER_FONT, None, None, None),
+    "PL Under":              (_UNDER_FONT, None, None, None),
+    "PL Finding":            (_FINDING_FONT, None, None, None),
+    "PL Savings":            (_SAVINGS_FONT, None, None, None),
+    "PL Savings Currency":   (_SAVINGS_FONT, None, _CURRENCY_FMT, None),
+}
+
+# Benchmark Mapping status column: color-coded Over / Under, plain otherwise
+_STATUS_STYLES = {"Over": "PL Over", "Under": "PL Under"}
+
+# FA Employee Analysis salary band labels, one per interval of
+# SALARY_BAND_THRESHOLDS (indexed by bisect_right)
+_SALARY_BANDS = ("Under $55K", "$55K to $85K", "$85K to $150K", "$150K+")
 
 
 # ---------------------------------------------------------------------------
@@ -119,312 +169,414 @@ BENCHMARK_MAP = {
     },
 }
 
-# These are populated dynamically from the Benchmarks and P&L Summary sheets
-# at runtime by read_source_data(). Initialized here as module-level state.
-BENCHMARK_TARGETS = {}
-REVENUE = 0
-REVENUE_BREAKDOWN = {}
-PL_SUMMARY = {}
+# Fallback category for departments not listed in BENCHMARK_MAP.
+_FUNC_DEFAULT = {
+    "G&A":             "Shared Services",
+    "S&M":             "Sales",
+    "R&D":             "Engineering",
+    "Cost of Product": "Product",
+    "Cost of PSO":     "Product",
+}
+
+
+def _build_classify_table() -> dict:
+    """Unfold BENCHMARK_MAP into a flat (func_l2, dept, category) -> benchmark lookup.
+
+    The category slot is None except for Cloud Operations, where only the
+    Hosting expense category maps to the Hosting benchmark.
+    """
+    table = {}
+    for group, depts in BENCHMARK_MAP.items():
+        func_l2 = group.split("_")[0]
+        for dept, cat in depts.items():
+            if cat is not None:
+                table[(func_l2, dept, None)] = cat
+    table[("Cost of Product", "Cloud Operations", "hosting")] = "Hosting"
+    table[("Cost of Product", "Cloud Operations", None)] = "Product"
+    return table
+
+
+_CLASSIFY = _build_classify_table()
+
+# Raw cell string -> stripped, interned form. Seeded with the known
+# Function L2 / Dept names and filled in by _canonical() during aggregation.
+_STRIP_CACHE = {
+    name: sys.intern(name)
+    for func_l2, dept, _ in _CLASSIFY
+    for name in (func_l2, dept)
+}
+
+
+def _canonical(value: str) -> str:
+    """Return the stripped, interned form of a cell string, caching it."""
+    canon = _STRIP_CACHE.get(value)
+    if canon is None:
+        canon = _STRIP_CACHE[value] = sys.intern(value.strip())
+    return canon
+
+
+# ---------------------------------------------------------------------------
+# Source data
+# ---------------------------------------------------------------------------
+
+@dataclass(frozen=True)
+class ExpenseAggregates:
+    """Expense totals from a single pass over the Empl., OPEX and COGS sheets."""
+
+    hc_by_cat: dict       # benchmark category -> employee cost
+    nhc_by_cat: dict      # benchmark category -> non-employee cost (OPEX + COGS)
+    hc_by_dept: dict      # G&A sub-department -> employee cost
+    count_by_dept: dict   # G&A sub-department -> employee count
+    nhc_by_dept: dict     # G&A sub-department -> non-employee OPEX cost
+
+
+@dataclass(frozen=True)
+class SourceData:
+    """Everything read from the 8 input sheets, passed to each sheet builder."""
+
+    revenue: float
+    benchmark_targets: dict   # benchmark category -> target % of revenue
+    pl_summary: dict          # P&L Summary label -> 2018 total
+    revenue_breakdown: MappingProxyType  # "Recurring" / "PSO" / "Perpetual" -> {"total", "count"}
+    agg: ExpenseAggregates
+
+
+def open_source_workbook(path: str):
+    """Open the input P&L for reading.
+
+    Uses python-calamine when installed, otherwise openpyxl in read-only
+    mode. Both resolve formula cells to their cached values.
+    """
+    if CalamineWorkbook is not None:
+        return CalamineWorkbook.from_path(path)
+    return load_workbook(path, data_only=True, read_only=True)
+
+
+def _iter_rows(wb, sheet_name: str, min_row: int, min_col: int = 1, max_col: int = None):
+    """Iterate row values of a sheet opened by open_source_workbook().
+
+    Rows start at `min_row` and are limited to columns `min_col`..`max_col`
+    (1-based, inclusive). As with openpyxl's iter_rows(values_only=True),
+    each row is a tuple of `max_col - min_col + 1` values with None for
+    empty cells. The number of trailing empty rows differs between the
+    two readers, so callers must skip empty rows.
+    """
+    if CalamineWorkbook is not None and isinstance(wb, CalamineWorkbook):
+        rows = wb.get_sheet_by_name(sheet_name).to_python(skip_empty_area=False)[min_row - 1:]
+        return _calamine_rows(rows, min_col, max_col)
+    return wb[sheet_name].iter_rows(min_row=min_row, min_col=min_col, max_col=max_col, values_only=True)
+
+
+def _calamine_rows(rows, min_col: int, max_col: int = None):
+    """Convert calamine row lists to openpyxl-style value tuples.
+
+    Calamine returns empty cells as '' and only the used columns; map ''
+    to None and pad short rows out to `max_col`.
+    """
+    width = max_col - min_col + 1 if max_col else None
+    for row in rows:
+        values = tuple(None if v == "" else v for v in row[min_col - 1:max_col])
+        if width and len(values) < width:
+            values += (None,) * (width - len(values))
+        yield values
 
 
-def read_source_data(wb) -> None:
-    """Read Benchmarks, P&L Summary, and Revenue sheets to populate module state.
+def read_source_data(wb) -> SourceData:
+    """Read all 8 input sheets into a SourceData.
 
-    This ensures all 8 input sheets are actively processed, not hardcoded.
+    Benchmarks, P&L Summary and the Revenue sheets are read here; the
+    expense sheets are aggregated by aggregate_source_data(). This ensures
+    all 8 input sheets are actively processed, not hardcoded.
     """
-    global BENCHMARK_TARGETS, REVENUE, REVENUE_BREAKDOWN, PL_SUMMARY
+    benchmark_targets = {}
+    pl_summary = {}
+    revenue_breakdown = {}
 
     # --- Sheet 1: Benchmarks ---
-    ws = wb["Benchmarks"]
-    for row in ws.iter_rows(min_row=2, max_row=ws.max_row, values_only=True):
-        category, benchmark = row[0], row[1]
+    for category, benchmark in _iter_rows(wb, "Benchmarks", min_row=2, max_col=2):
         if category and benchmark and isinstance(benchmark, (int, float)):
             if category not in ("Margin", "Expense Total"):
-                BENCHMARK_TARGETS[category] = benchmark
-    print(f"  Benchmarks: {len(BENCHMARK_TARGETS)} categories loaded")
+                benchmark_targets[category] = benchmark
+    print(f"  Benchmarks: {len(benchmark_targets)} categories loaded")
 
     # --- Sheet 2: P&L Summary ---
-    ws = wb["P&L Summary"]
-    for row in ws.iter_rows(min_row=2, max_row=ws.max_row):
-        label = row[0].value
-        value = row[1].value
+    for label, value in _iter_rows(wb, "P&L Summary", min_row=2, max_col=2):
         if label and value is not None and isinstance(value, (int, float)):
-            PL_SUMMARY[label.strip()] = value
-    REVENUE = PL_SUMMARY.get("Revenue", 0)
-    margin = PL_SUMMARY.get("Margin", 0)
-    print(f"  P&L Summary: Revenue = ${REVENUE:,.0f}, Margin = ${margin:,.0f} ({margin/REVENUE:.1%})" if REVENUE else "  P&L Summary: loaded")
+            pl_summary[label.strip()] = value
+    revenue = pl_summary.get("Revenue", 0)
+    margin = pl_summary.get("Margin", 0)
+    print(f"  P&L Summary: Revenue = ${revenue:,.0f}, Margin = ${margin:,.0f} ({margin/revenue:.1%})" if revenue else "  P&L Summary: loaded")
 
     # --- Sheets 6-8: Revenue breakdown ---
     # Structure: Row 3 = headers (Tier, Type, Customer Name, 2018 total)
-    # Data starts at row 4, column D (index 3) = amount
+    # Data starts at row 4; only column D (2018 total) is read
     for sheet_name in ["RecurringRevenue", "PSORevenue", "PerpetualRevenue"]:
-        ws = wb[sheet_name]
         total = 0
         count = 0
-        for row in ws.iter_rows(min_row=4, max_row=ws.max_row):
-            val = row[3].value  # Column D: 2018 total
-            if val and isinstance(val, (int, float)):
+        for (val,) in _iter_rows(wb, sheet_name, min_row=4, min_col=4, max_col=4):
+            if not val:
+                continue
+            try:
                 total += val
-                count += 1
+            except TypeError:
+                continue  # text cell
+            count += 1
         # Clean name: "RecurringRevenue" -> "Recurring"
         clean_name = sheet_name.replace("Revenue", "")
-        REVENUE_BREAKDOWN[clean_name] = {"total": total, "count": count}
-    rev_parts = ", ".join(f"{k}: ${v['total']:,.0f} ({v['count']} items)" for k, v in REVENUE_BREAKDOWN.items())
+        revenue_breakdown[clean_name] = MappingProxyType({"total": total, "count": count})
+    rev_parts = ", ".join(f"{k}: ${v['total']:,.0f} ({v['count']} items)" for k, v in revenue_breakdown.items())
     print(f"  Revenue sheets: {rev_parts}")
 
+    return SourceData(
+        revenue=revenue,
+        benchmark_targets=benchmark_targets,
+        pl_summary=pl_summary,
+        revenue_breakdown=MappingProxyType(revenue_breakdown),
+        agg=aggregate_source_data(wb),
+    )
 
+
+@lru_cache(maxsize=None)
 def classify_benchmark(func_l2: str, dept: str, category: str = None) -> str:
-    """Determine benchmark category for a line item."""
+    """Determine benchmark category for a line item.
+
+    Inputs must already be stripped (see _canonical). Results are memoized,
+    so each distinct (func_l2, dept, category) is classified only once.
+    """
     if not func_l2 or not dept:
         return "Unclassified"
 
-    # Strip whitespace from all inputs
-    func_l2 = func_l2.strip()
-    dept = dept.strip()
     if category:
-        category = category.strip()
-
-    # Executive Team (G&A sub-depts)
-    if func_l2 == "G&A" and dept in ("GMs & Office Admins", "Corporate"):
-        return "Executive Team"
-
-    # G&A -> Shared Services
-    if func_l2 == "G&A":
-        return "Shared Services"
-
-    # S&M
-    if func_l2 == "S&M":
-        if dept == "Marketing":
-            return "Marketing"
-        return "Sales"
-
-    # R&D
-    if func_l2 == "R&D":
-        return "Engineering"
-
-    # Cost of Product
-    if func_l2 == "Cost of Product":
-        if dept in ("Technical Support", "Enhanced Support"):
-            return "Technical Support"
-        if dept == "Cloud Operations":
-            # Only the Hosting expense category maps to Hosting benchmark
-            if category and category.lower() == "hosting":
-                return "Hosting"
-            return "Product"
-        if dept == "Customer Success":
-            return "Product"
-        return "Product"
+        cat = _CLASSIFY.get((func_l2, dept, category.lower()))
+        if cat:
+            return cat
+    return _CLASSIFY.get((func_l2, dept, None)) or _FUNC_DEFAULT.get(func_l2, "Unclassified")
 
-    # Cost of PSO
-    if func_l2 == "Cost of PSO":
-        if dept == "Funded R&D":
-            return "Engineering"
-        return "Product"
 
-    return "Unclassified"
+def aggregate_source_data(wb) -> ExpenseAggregates:
+    """Aggregate Empl., OPEX and COGS costs in one pass per sheet.
+
+    Each row's strings are canonicalized once (stripped and interned via
+    _canonical) and classified once, then added to every total the
+    sheet builders need (benchmark categories and G&A sub-departments).
+    Only the used column window of each sheet is read.
+    """
+    hc_by_cat = defaultdict(float)
+    nhc_by_cat = defaultdict(float)
+    hc_by_dept = defaultdict(float)
+    count_by_dept = Counter()
+    nhc_by_dept = defaultdict(float)
+
+    # Employee costs: col D = Function L2, col E = DEPT, col G = 2018 total
+    for row in _iter_rows(wb, "Empl.", min_row=4, min_col=4, max_col=7):
+        func_l2, dept, cost = row[0], row[1], row[3]
+        if not dept:
+            continue
+        func_l2 = _canonical(func_l2) if func_l2 else func_l2
+        dept = _canonical(dept)
+        valid = cost and isinstance(cost, (int, float))
+        if valid:
+            cat = classify_benchmark(func_l2, dept)
+            hc_by_cat[cat] += cost
+        if func_l2 == "G&A":
+            # Zero-cost employees still count toward headcount
+            hc_by_dept[dept] += cost if valid else 0
+            count_by_dept[dept] += 1
+
+    # Non-employee costs: col B = Function L2, col C = Dept,
+    # col D = Category, col F = 2018 total
+    for sheet_name in ("OPEX - NEmpl.", "COGS - NEmpl."):
+        for row in _iter_rows(wb, sheet_name, min_row=3, min_col=2, max_col=6):
+            func_l2, dept, category, cost = row[0], row[1], row[2], row[4]
+            if not dept or not cost or not isinstance(cost, (int, float)):
+                continue
+            func_l2 = _canonical(func_l2) if func_l2 else func_l2
+            dept = _canonical(dept)
+            category = _canonical(category) if category else category
+            cat = classify_benchmark(func_l2, dept, category)
+            nhc_by_cat[cat] += cost
+            if func_l2 == "G&A" and sheet_name == "OPEX - NEmpl.":
+                nhc_by_dept[dept] += cost
+
+    # Plain dicts for the builders, so lookups of missing keys don't insert them
+    return ExpenseAggregates(
+        hc_by_cat=dict(hc_by_cat),
+        nhc_by_cat=dict(nhc_by_cat),
+        hc_by_dept=dict(hc_by_dept),
+        count_by_dept=dict(count_by_dept),
+        nhc_by_dept=dict(nhc_by_dept),
+    )
 
 
 # ---------------------------------------------------------------------------
 # Sheet builders
 # ---------------------------------------------------------------------------
 
-def _write_header(ws, headers: list[str], row: int = 1) -> None:
-    """Write styled header row."""
-    for col, header in enumerate(headers, 1):
-        cell = ws.cell(row=row, column=col, value=header)
-        cell.font = _HEADER_FONT
-        cell.fill = _HEADER_FILL
-        cell.alignment = _WRAP
+def _register_styles(wb) -> None:
+    """Add the _NAMED_STYLES cell styles to the workbook if not already present."""
+    for name, (font, fill, number_format, alignment) in _NAMED_STYLES.items():
+        if name in wb.named_styles:
+            continue
+        style = NamedStyle(name=name, font=font)
+        if fill:
+            style.fill = fill
+        if number_format:
+            style.number_format = number_format
+        if alignment:
+            style.alignment = alignment
+        wb.add_named_style(style)
+
+
+class _ColWidths:
+    """Track auto-fit column widths as cells are written."""
+
+    def __init__(self, min_width: int = 12, max_width: int = 45) -> None:
+        self.min_width = min_width
+        self.max_width = max_width
+        self.widths = {}
+
+    def update(self, col: int, val) -> None:
+        """Widen column `col` to fit `val`, capped at max_width."""
+        widths = self.widths
+        width = widths.get(col, self.min_width)
+        if val:
+            fit = len(str(val)) + 2
+            if fit > width:
+                width = min(fit, self.max_width)
+        widths[col] = width
+
+    def apply(self, ws) -> None:
+        """Set one width per tracked column."""
+        dims = ws.column_dimensions
+        gcl = get_column_letter
+        for col, width in self.widths.items():
+            dims[gcl(col)].width = width
+
+
+def _append_row(ws, cw: _ColWidths, values, styles) -> None:
+    """Append one row of styled cells in a single ws.append call.
+
+    `values` and `styles` are parallel sequences; a None value leaves that
+    cell empty.
+    """
+    row = []
+    add = row.append
+    update = cw.update
+    make_cell = Cell
+    for col, (value, style) in enumerate(zip(values, styles), 1):
+        if value is None:
+            add(None)
+            continue
+        cell = make_cell(ws, value=value)
+        cell.style = style
+        update(col, value)
+        add(cell)
+    ws.append(row)
 
 
-def _auto_width(ws, min_width: int = 12, max_width: int = 45) -> None:
-    """Auto-fit column widths."""
-    for col in range(1, ws.max_column + 1):
-        max_len = min_width
-        for row in range(1, ws.max_row + 1):
-            val = ws.cell(row=row, column=col).value
-            if val:
-                max_len = max(max_len, min(len(str(val)) + 2, max_width))
-        ws.column_dimensions[get_column_letter(col)].width = max_len
+def _write_header(ws, cw: _ColWidths, headers: list[str]) -> None:
+    """Append styled header row."""
+    _append_row(ws, cw, headers, ("PL Header",) * len(headers))
 
 
-def build_benchmark_mapping(wb) -> None:
+def build_benchmark_mapping(wb, sd: SourceData) -> None:
     """Sheet 1: Map every expense line to a benchmark category."""
+    _register_styles(wb)
     ws = wb.create_sheet("Benchmark Mapping")
+    cw = _ColWidths()
+    rev = sd.revenue
+    inv_rev = 1.0 / rev if rev else 0.0
+    _round = round
+    targets = sd.benchmark_targets
+    agg = sd.agg
 
     headers = [
         "Benchmark Category", "HC Cost", "Non-HC Cost",
         "Total Cost", "% of Revenue", "Benchmark Target",
         "Variance", "Status"
     ]
-    _write_header(ws, headers)
-
-    # Aggregate costs by benchmark category
-    # Employee costs
-    empl_ws = wb["Empl."]
-    hc_by_cat = {}
-    for row in empl_ws.iter_rows(min_row=4, max_row=empl_ws.max_row):
-        func_l2 = row[3].value  # col D: Function L2
-        dept = row[4].value     # col E: DEPT
-        cost = row[6].value     # col G: 2018 total
-        if not dept or not cost or not isinstance(cost, (int, float)):
-            continue
-        cat = classify_benchmark(func_l2, dept)
-        hc_by_cat[cat] = hc_by_cat.get(cat, 0) + cost
-
-    # OPEX non-employee costs
-    opex_ws = wb["OPEX - NEmpl."]
-    nhc_by_cat = {}
-    for row_data in opex_ws.iter_rows(min_row=3, max_row=opex_ws.max_row):
-        func_l2 = row_data[1].value  # col B: Function L2
-        dept = row_data[2].value     # col C: Dept
-        category = row_data[3].value # col D: Category
-        cost = row_data[5].value     # col F: 2018 total
-        if not dept or not cost or not isinstance(cost, (int, float)):
-            continue
-        cat = classify_benchmark(func_l2, dept, category)
-        nhc_by_cat[cat] = nhc_by_cat.get(cat, 0) + cost
-
-    # COGS non-employee costs
-    cogs_ws = wb["COGS - NEmpl."]
-    for row_data in cogs_ws.iter_rows(min_row=3, max_row=cogs_ws.max_row):
-        func_l2 = row_data[1].value
-        dept = row_data[2].value
-        category = row_data[3].value
-        cost = row_data[5].value
-        if not dept or not cost or not isinstance(cost, (int, float)):
-            continue
-        cat = classify_benchmark(func_l2, dept, category)
-        nhc_by_cat[cat] = nhc_by_cat.get(cat, 0) + cost
+    _write_header(ws, cw, headers)
 
-    # Write rows
-    all_cats = sorted(set(list(hc_by_cat.keys()) + list(nhc_by_cat.keys())))
-    # Put in benchmark order
-    ordered = [c for c in BENCHMARK_TARGETS.keys() if c in all_cats]
-    ordered += [c for c in all_cats if c not in ordered]
+    hc_by_cat = agg.hc_by_cat
+    nhc_by_cat = agg.nhc_by_cat
 
-    r = 2
+    # Write rows
+    all_cats = sorted(hc_by_cat.keys() | nhc_by_cat.keys())
+    # Put in benchmark order, then any remaining categories alphabetically
+    ordered = [c for c in targets if c in hc_by_cat or c in nhc_by_cat]
+    seen = set(ordered)
+    ordered.extend(c for c in all_cats if c not in seen)
+
+    row_styles = (
+        "PL Bold", "PL Data Currency", "PL Data Currency", "PL Bold Currency",
+        "PL Data Pct", "PL Data Pct", "PL Data Pct",
+    )
     total_hc = 0
     total_nhc = 0
     for cat in ordered:
         hc = hc_by_cat.get(cat, 0)
         nhc = nhc_by_cat.get(cat, 0)
         total = hc + nhc
-        pct = total / REVENUE
-        target = BENCHMARK_TARGETS.get(cat, 0)
+        pct = total * inv_rev
+        target = targets.get(cat, 0)
         variance = pct - target
         status = "Over" if variance > 0.001 else ("At target" if abs(variance) <= 0.001 else "Under")
 
-        ws.cell(row=r, column=1, value=cat).font = _BOLD_FONT
-        ws.cell(row=r, column=2, value=round(hc)).font = _DATA_FONT
-        ws.cell(row=r, column=2).number_format = _CURRENCY_FMT
-        ws.cell(row=r, column=3, value=round(nhc)).font = _DATA_FONT
-        ws.cell(row=r, column=3).number_format = _CURRENCY_FMT
-        ws.cell(row=r, column=4, value=round(total)).font = _BOLD_FONT
-        ws.cell(row=r, column=4).number_format = _CURRENCY_FMT
-        ws.cell(row=r, column=5, value=pct).font = _DATA_FONT
-        ws.cell(row=r, column=5).number_format = _PCT_FMT
-        ws.cell(row=r, column=6, value=target).font = _DATA_FONT
-        ws.cell(row=r, column=6).number_format = _PCT_FMT
-        ws.cell(row=r, column=7, value=variance).font = _DATA_FONT
-        ws.cell(row=r, column=7).number_format = _PCT_FMT
-        ws.cell(row=r, column=8, value=status).font = _DATA_FONT
-
-        # Color code status
-        if status == "Over":
-            ws.cell(row=r, column=8).font = Font(name="Arial", size=9, color="CC0000", bold=True)
-        elif status == "Under":
-            ws.cell(row=r, column=8).font = Font(name="Arial", size=9, color="008000")
+        _append_row(
+            ws, cw,
+            [cat, _round(hc), _round(nhc), _round(total), pct, target, variance, status],
+            row_styles + (_STATUS_STYLES.get(status, "PL Data"),),
+        )
 
         total_hc += hc
         total_nhc += nhc
-        r += 1
 
     # Totals row
-    ws.cell(row=r, column=1, value="TOTAL").font = _BOLD_FONT
-    ws.cell(row=r, column=1).fill = _TOTAL_FILL
-    ws.cell(row=r, column=2, value=round(total_hc)).font = _BOLD_FONT
-    ws.cell(row=r, column=2).number_format = _CURRENCY_FMT
-    ws.cell(row=r, column=2).fill = _TOTAL_FILL
-    ws.cell(row=r, column=3, value=round(total_nhc)).font = _BOLD_FONT
-    ws.cell(row=r, column=3).number_format = _CURRENCY_FMT
-    ws.cell(row=r, column=3).fill = _TOTAL_FILL
     total_all = total_hc + total_nhc
-    ws.cell(row=r, column=4, value=round(total_all)).font = _BOLD_FONT
-    ws.cell(row=r, column=4).number_format = _CURRENCY_FMT
-    ws.cell(row=r, column=4).fill = _TOTAL_FILL
-    ws.cell(row=r, column=5, value=total_all / REVENUE).font = _BOLD_FONT
-    ws.cell(row=r, column=5).number_format = _PCT_FMT
-    ws.cell(row=r, column=5).fill = _TOTAL_FILL
-    ws.cell(row=r, column=6, value=0.30).font = _BOLD_FONT
-    ws.cell(row=r, column=6).number_format = _PCT_FMT
-    ws.cell(row=r, column=6).fill = _TOTAL_FILL
-
-    _auto_width(ws)
+    _append_row(
+        ws, cw,
+        ["TOTAL", _round(total_hc), _round(total_nhc), _round(total_all), total_all * inv_rev, 0.30],
+        ("PL Total", "PL Total Currency", "PL Total Currency", "PL Total Currency",
+         "PL Total Pct", "PL Total Pct"),
+    )
 
     # Summary at top note
-    r += 2
-    ws.cell(row=r, column=1, value="Revenue:").font = _BOLD_FONT
-    ws.cell(row=r, column=2, value=REVENUE).font = _DATA_FONT
-    ws.cell(row=r, column=2).number_format = _CURRENCY_FMT
-    r += 1
-    ws.cell(row=r, column=1, value="Margin Target:").font = _BOLD_FONT
-    ws.cell(row=r, column=2, value="70%").font = _DATA_FONT
-    r += 1
-    ws.cell(row=r, column=1, value="Actual Margin:").font = _BOLD_FONT
-    ws.cell(row=r, column=2, value="8.86%").font = _DATA_FONT
-
-
-def build_shared_services_breakdown(wb) -> None:
+    ws.append([])
+    _append_row(ws, cw, ["Revenue:", rev], ("PL Bold", "PL Data Currency"))
+    _append_row(ws, cw, ["Margin Target:", "70%"], ("PL Bold", "PL Data"))
+    _append_row(ws, cw, ["Actual Margin:", "8.86%"], ("PL Bold", "PL Data"))
+
+    cw.apply(ws)
+
+
+def build_shared_services_breakdown(wb, sd: SourceData) -> None:
     """Sheet 2: Break down Shared Services into G&A sub-departments."""
+    _register_styles(wb)
     ws = wb.create_sheet("SS Breakdown")
+    cw = _ColWidths()
+    rev = sd.revenue
+    inv_rev = 1.0 / rev if rev else 0.0
+    _round = round
+    agg = sd.agg
 
     headers = [
         "G&A Sub-Department", "Employee Count", "HC Cost",
         "Non-HC Cost", "Total Cost", "% of Revenue"
     ]
-    _write_header(ws, headers)
-
-    # Aggregate employee costs by G&A sub-department
-    empl_ws = wb["Empl."]
-    hc_by_dept = {}
-    count_by_dept = {}
-    for row in empl_ws.iter_rows(min_row=4, max_row=empl_ws.max_row):
-        func_l2 = row[3].value
-        dept = row[4].value
-        cost = row[6].value
-        if not func_l2 or not dept:
-            continue
-        func_l2 = func_l2.strip()
-        dept = dept.strip()
-        if func_l2 != "G&A":
-            continue
-        if not cost or not isinstance(cost, (int, float)):
-            cost = 0
-        hc_by_dept[dept] = hc_by_dept.get(dept, 0) + cost
-        count_by_dept[dept] = count_by_dept.get(dept, 0) + 1
-
-    # Aggregate non-HC OPEX by G&A sub-department
-    opex_ws = wb["OPEX - NEmpl."]
-    nhc_by_dept = {}
-    for row_data in opex_ws.iter_rows(min_row=3, max_row=opex_ws.max_row):
-        func_l2 = row_data[1].value
-        dept = row_data[2].value
-        cost = row_data[5].value
-        if not func_l2 or not dept:
-            continue
-        func_l2 = func_l2.strip()
-        dept = dept.strip()
-        if func_l2 != "G&A":
-            continue
-        if not cost or not isinstance(cost, (int, float)):
-            continue
-        nhc_by_dept[dept] = nhc_by_dept.get(dept, 0) + cost
+    _write_header(ws, cw, headers)
+
+    hc_by_dept = agg.hc_by_dept
+    count_by_dept = agg.count_by_dept
+    nhc_by_dept = agg.nhc_by_dept
 
-    # All G&A departments
-    all_depts = sorted(set(list(hc_by_dept.keys()) + list(nhc_by_dept.keys())))
+    # All G&A departments, alphabetically
+    all_depts = sorted(hc_by_dept.keys() | nhc_by_dept.keys())
 
-    r = 2
+    # F&A is highlighted
+    data_styles = ("PL Data", "PL Data", "PL Data Currency", "PL Data Currency",
+                   "PL Data Currency", "PL Data Pct")
+    highlight_styles = ("PL Highlight", "PL Highlight", "PL Highlight Currency",
+                        "PL Highlight Currency", "PL Highlight Currency", "PL Highlight Pct")
     total_count = 0
     total_hc = 0
     total_nhc = 0
@@ -433,302 +585,241 @@ def build_shared_services_breakdown(wb) -> None:
         hc = hc_by_dept.get(dept, 0)
         nhc = nhc_by_dept.get(dept, 0)
         total = hc + nhc
-        pct = total / REVENUE
-
-        # Highlight F&A
-        font = _BOLD_FONT if dept == "Finance & Accounting" else _DATA_FONT
-        highlight = PatternFill(start_color="FFF2CC", end_color="FFF2CC", fill_type="solid") if dept == "Finance & Accounting" else None
-
-        cell = ws.cell(row=r, column=1, value=dept)
-        cell.font = font
-        if highlight:
-            cell.fill = highlight
-
-        for col, val, fmt in [
-            (2, count, None),
-            (3, round(hc), _CURRENCY_FMT),
-            (4, round(nhc), _CURRENCY_FMT),
-            (5, round(total), _CURRENCY_FMT),
-            (6, pct, _PCT_FMT),
-        ]:
-            c = ws.cell(row=r, column=col, value=val)
-            c.font = font
-            if fmt:
-                c.number_format = fmt
-            if highlight:
-                c.fill = highlight
+        pct = total * inv_rev
+
+        _append_row(
+            ws, cw,
+            [dept, count, _round(hc), _round(nhc), _round(total), pct],
+            highlight_styles if dept == "Finance & Accounting" else data_styles,
+        )
 
         total_count += count
         total_hc += hc
         total_nhc += nhc
-        r += 1
 
     # Totals
     total_all = total_hc + total_nhc
-    ws.cell(row=r, column=1, value="TOTAL G&A (Shared Services)").font = _BOLD_FONT
-    ws.cell(row=r, column=1).fill = _TOTAL_FILL
-    for col, val, fmt in [
-        (2, total_count, None),
-        (3, round(total_hc), _CURRENCY_FMT),
-        (4, round(total_nhc), _CURRENCY_FMT),
-        (5, round(total_all), _CURRENCY_FMT),
-        (6, total_all / REVENUE, _PCT_FMT),
-    ]:
-        c = ws.cell(row=r, column=col, value=val)
-        c.font = _BOLD_FONT
-        c.fill = _TOTAL_FILL
-        if fmt:
-            c.number_format = fmt
-
-    r += 2
-    ws.cell(row=r, column=1, value="Shared Services Benchmark:").font = _BOLD_FONT
-    ws.cell(row=r, column=2, value="4.5% of revenue").font = _DATA_FONT
-    r += 1
-    ws.cell(row=r, column=1, value="F&A alone:").font = _BOLD_FONT
+    _append_row(
+        ws, cw,
+        ["TOTAL G&A (Shared Services)", total_count, _round(total_hc), _round(total_nhc),
+         _round(total_all), total_all * inv_rev],
+        ("PL Total", "PL Total", "PL Total Currency", "PL Total Currency",
+         "PL Total Currency", "PL Total Pct"),
+    )
+
+    ws.append([])
+    _append_row(ws, cw, ["Shared Services Benchmark:", "4.5% of revenue"], ("PL Bold", "PL Data"))
     fa_total = hc_by_dept.get("Finance & Accounting", 0) + nhc_by_dept.get("Finance & Accounting", 0)
-    ws.cell(row=r, column=2, value=f"${fa_total:,.0f} ({fa_total/REVENUE:.1%} of revenue)").font = _DATA_FONT
-    r += 1
-    ws.cell(row=r, column=1, value="Finding:").font = Font(name="Arial", size=9, bold=True, color="CC0000")
-    ws.cell(row=r, column=2, value="F&A alone exceeds the entire Shared Services benchmark").font = Font(name="Arial", size=9, color="CC0000")
+    _append_row(
+        ws, cw,
+        ["F&A alone:", f"${fa_total:,.0f} ({fa_total * inv_rev:.1%} of revenue)"],
+        ("PL Bold", "PL Data"),
+    )
+    _append_row(
+        ws, cw,
+        ["Finding:", "F&A alone exceeds the entire Shared Services benchmark"],
+        ("PL Over", "PL Finding"),
+    )
 
-    _auto_width(ws)
+    cw.apply(ws)
 
 
-def build_fa_deep_dive(wb) -> None:
+def build_fa_deep_dive(wb, sd: SourceData) -> None:
     """Sheet 3: F&A cost breakdown by component with in-model comparison."""
+    _register_styles(wb)
     ws = wb.create_sheet("FA Deep Dive")
+    cw = _ColWidths()
+    rev = sd.revenue
+    inv_rev = 1.0 / rev if rev else 0.0
+    _round = round
 
     # Section 1: Current F&A Cost Breakdown
     headers = ["Cost Component", "Amount", "% of F&A Total", "% of Revenue"]
-    _write_header(ws, headers)
+    _write_header(ws, cw, headers)
 
     current = get_current_fa_cost()
     fa_total = current["total"]
 
     # HC row
-    r = 2
-    ws.cell(row=r, column=1, value="Employee Headcount (18 staff)").font = _BOLD_FONT
-    ws.cell(row=r, column=2, value=round(current["headcount_cost"])).font = _DATA_FONT
-    ws.cell(row=r, column=2).number_format = _CURRENCY_FMT
-    ws.cell(row=r, column=3, value=current["headcount_cost"] / fa_total).font = _DATA_FONT
-    ws.cell(row=r, column=3).number_format = _PCT_FMT
-    ws.cell(row=r, column=4, value=current["headcount_cost"] / REVENUE).font = _DATA_FONT
-    ws.cell(row=r, column=4).number_format = _PCT_FMT
-    r += 1
+    _append_row(
+        ws, cw,
+        ["Employee Headcount (18 staff)", _round(current["headcount_cost"]),
+         current["headcount_cost"] / fa_total, current["headcount_cost"] * inv_rev],
+        ("PL Bold", "PL Data Currency", "PL Data Pct", "PL Data Pct"),
+    )
 
     # Non-HC breakdown
+    row_styles = ("PL Data", "PL Data Currency", "PL Data Pct", "PL Data Pct")
     for category, amount in sorted(CURRENT_FA_OPEX.items(), key=lambda x: -x[1]):
-        ws.cell(row=r, column=1, value=f"  {category}").font = _DATA_FONT
-        ws.cell(row=r, column=2, value=round(amount)).font = _DATA_FONT
-        ws.cell(row=r, column=2).number_format = _CURRENCY_FMT
-        ws.cell(row=r, column=3, value=amount / fa_total).font = _DATA_FONT
-        ws.cell(row=r, column=3).number_format = _PCT_FMT
-        ws.cell(row=r, column=4, value=amount / REVENUE).font = _DATA_FONT
-        ws.cell(row=r, column=4).number_format = _PCT_FMT
-        r += 1
+        _append_row(
+            ws, cw,
+            [f"  {category}", _round(amount), amount / fa_total, amount * inv_rev],
+            row_styles,
+        )
 
     # Total
-    ws.cell(row=r, column=1, value="TOTAL F&A").font = _BOLD_FONT
-    ws.cell(row=r, column=1).fill = _TOTAL_FILL
-    ws.cell(row=r, column=2, value=round(fa_total)).font = _BOLD_FONT
-    ws.cell(row=r, column=2).number_format = _CURRENCY_FMT
-    ws.cell(row=r, column=2).fill = _TOTAL_FILL
-    ws.cell(row=r, column=3, value=1.0).font = _BOLD_FONT
-    ws.cell(row=r, column=3).number_format = _PCT_FMT
-    ws.cell(row=r, column=3).fill = _TOTAL_FILL
-    ws.cell(row=r, column=4, value=fa_total / REVENUE).font = _BOLD_FONT
-    ws.cell(row=r, column=4).number_format = _PCT_FMT
-    ws.cell(row=r, column=4).fill = _TOTAL_FILL
+    _append_row(
+        ws, cw,
+        ["TOTAL F&A", _round(fa_total), 1.0, fa_total * inv_rev],
+        ("PL Total", "PL Total Currency", "PL Total Pct", "PL Total Pct"),
+    )
 
     # Section 2: Central Finance Target Model
-    r += 3
-    _write_header(ws, ["Central Finance Model", "Headcount", "Cost per Role", "Total Cost"], r)
-    r += 1
+    ws.append([])
+    ws.append([])
+    _write_header(ws, cw, ["Central Finance Model", "Headcount", "Cost per Role", "Total Cost"])
 
     target = get_target_fa_model()
+    row_styles = ("PL Data", "PL Data", "PL Data Currency", "PL Data Currency")
     for role in target["roles"]:
-        ws.cell(row=r, column=1, value=role["role"]).font = _DATA_FONT
-        ws.cell(row=r, column=2, value=role["count"]).font = _DATA_FONT
-        ws.cell(row=r, column=3, value=role["annual"]).font = _DATA_FONT
-        ws.cell(row=r, column=3).number_format = _CURRENCY_FMT
-        ws.cell(row=r, column=4, value=role["count"] * role["annual"]).font = _DATA_FONT
-        ws.cell(row=r, column=4).number_format = _CURRENCY_FMT
-        r += 1
+        _append_row(
+            ws, cw,
+            [role["role"], role["count"], role["annual"], role["count"] * role["annual"]],
+            row_styles,
+        )
 
     # Statutory audit
-    ws.cell(row=r, column=1, value="Statutory Audit (retained)").font = _DATA_FONT
-    ws.cell(row=r, column=4, value=target["statutory_audit"]).font = _DATA_FONT
-    ws.cell(row=r, column=4).number_format = _CURRENCY_FMT
-    r += 1
+    _append_row(
+        ws, cw,
+        ["Statutory Audit (retained)", None, None, target["statutory_audit"]],
+        ("PL Data", None, None, "PL Data Currency"),
+    )
 
     # Target total
-    ws.cell(row=r, column=1, value="TOTAL IN-MODEL COST").font = _BOLD_FONT
-    ws.cell(row=r, column=1).fill = _TOTAL_FILL
-    ws.cell(row=r, column=2, value=target["headcount"]).font = _BOLD_FONT
-    ws.cell(row=r, column=2).fill = _TOTAL_FILL
-    ws.cell(row=r, column=4, value=target["total"]).font = _BOLD_FONT
-    ws.cell(row=r, column=4).number_format = _CURRENCY_FMT
-    ws.cell(row=r, column=4).fill = _TOTAL_FILL
+    _append_row(
+        ws, cw,
+        ["TOTAL IN-MODEL COST", target["headcount"], None, target["total"]],
+        ("PL Total", "PL Total", None, "PL Total Currency"),
+    )
 
     # Section 3: Savings summary
-    r += 2
+    ws.append([])
     summary = get_savings_summary()
-    ws.cell(row=r, column=1, value="Current F&A Cost").font = _BOLD_FONT
-    ws.cell(row=r, column=2, value=round(summary["current_total"])).font = _DATA_FONT
-    ws.cell(row=r, column=2).number_format = _CURRENCY_FMT
-    r += 1
-    ws.cell(row=r, column=1, value="Target In-Model Cost").font = _BOLD_FONT
-    ws.cell(row=r, column=2, value=round(summary["target_total"])).font = _DATA_FONT
-    ws.cell(row=r, column=2).number_format = _CURRENCY_FMT
-    r += 1
-    ws.cell(row=r, column=1, value="ANNUAL SAVINGS").font = Font(name="Arial", size=10, bold=True, color="008000")
-    ws.cell(row=r, column=2, value=round(summary["annual_savings"])).font = Font(name="Arial", size=10, bold=True, color="008000")
-    ws.cell(row=r, column=2).number_format = _CURRENCY_FMT
-    r += 1
-    ws.cell(row=r, column=1, value="Reduction").font = _BOLD_FONT
-    ws.cell(row=r, column=2, value=summary["savings_pct"]).font = _DATA_FONT
-    ws.cell(row=r, column=2).number_format = _PCT_FMT
-
-    _auto_width(ws)
-
-
-def build_revenue_analysis(wb) -> None:
+    _append_row(ws, cw, ["Current F&A Cost", _round(summary["current_total"])],
+                ("PL Bold", "PL Data Currency"))
+    _append_row(ws, cw, ["Target In-Model Cost", _round(summary["target_total"])],
+                ("PL Bold", "PL Data Currency"))
+    _append_row(ws, cw, ["ANNUAL SAVINGS", _round(summary["annual_savings"])],
+                ("PL Savings", "PL Savings Currency"))
+    _append_row(ws, cw, ["Reduction", summary["savings_pct"]], ("PL Bold", "PL Data Pct"))
+
+    cw.apply(ws)
+
+
+def build_revenue_analysis(wb, sd: SourceData) -> None:
     """Sheet 5: Revenue breakdown from RecurringRevenue, PSORevenue, PerpetualRevenue sheets."""
+    _register_styles(wb)
     ws = wb.create_sheet("Revenue Analysis")
+    cw = _ColWidths()
+    rev = sd.revenue
+    inv_rev = 1.0 / rev if rev > 0 else 0.0
+    _round = round
+    breakdown = sd.revenue_breakdown
+    pl_summary = sd.pl_summary
 
     headers = ["Revenue Stream", "Amount", "% of Total", "Line Items", "Avg per Item"]
-    _write_header(ws, headers)
+    _write_header(ws, cw, headers)
 
-    r = 2
+    row_styles = ("PL Bold", "PL Data Currency", "PL Data Pct", "PL Data", "PL Data Currency")
     total_amount = 0
     total_items = 0
-    for stream, data in sorted(REVENUE_BREAKDOWN.items(), key=lambda x: -x[1]["total"]):
+    for stream, data in sorted(breakdown.items(), key=lambda x: -x[1]["total"]):
         amount = data["total"]
         count = data["count"]
-        pct = amount / REVENUE if REVENUE > 0 else 0
+        pct = amount * inv_rev
         avg = amount / count if count > 0 else 0
 
-        ws.cell(row=r, column=1, value=stream).font = _BOLD_FONT
-        ws.cell(row=r, column=2, value=round(amount)).font = _DATA_FONT
-        ws.cell(row=r, column=2).number_format = _CURRENCY_FMT
-        ws.cell(row=r, column=3, value=pct).font = _DATA_FONT
-        ws.cell(row=r, column=3).number_format = _PCT_FMT
-        ws.cell(row=r, column=4, value=count).font = _DATA_FONT
-        ws.cell(row=r, column=5, value=round(avg)).font = _DATA_FONT
-        ws.cell(row=r, column=5).number_format = _CURRENCY_FMT
+        _append_row(ws, cw, [stream, _round(amount), pct, count, _round(avg)], row_styles)
 
         total_amount += amount
         total_items += count
-        r += 1
 
     # Total row
-    ws.cell(row=r, column=1, value="TOTAL REVENUE").font = _BOLD_FONT
-    ws.cell(row=r, column=1).fill = _TOTAL_FILL
-    ws.cell(row=r, column=2, value=round(total_amount)).font = _BOLD_FONT
-    ws.cell(row=r, column=2).number_format = _CURRENCY_FMT
-    ws.cell(row=r, column=2).fill = _TOTAL_FILL
-    ws.cell(row=r, column=3, value=1.0).font = _BOLD_FONT
-    ws.cell(row=r, column=3).number_format = _PCT_FMT
-    ws.cell(row=r, column=3).fill = _TOTAL_FILL
-    ws.cell(row=r, column=4, value=total_items).font = _BOLD_FONT
-    ws.cell(row=r, column=4).fill = _TOTAL_FILL
+    _append_row(
+        ws, cw,
+        ["TOTAL REVENUE", _round(total_amount), 1.0, total_items],
+        ("PL Total", "PL Total Currency", "PL Total Pct", "PL Total"),
+    )
 
     # Key observations
-    r += 2
-    ws.cell(row=r, column=1, value="Key Observations:").font = _BOLD_FONT
-    r += 1
-    recurring_pct = REVENUE_BREAKDOWN.get("Recurring", {}).get("total", 0) / REVENUE if REVENUE > 0 else 0
-    ws.cell(row=r, column=1, value=f"Recurring revenue is {recurring_pct:.0%} of total. "
-            "High recurring base provides stable revenue for transformation investment.").font = _DATA_FONT
-    ws.merge_cells(start_row=r, start_column=1, end_row=r, end_column=5)
-    ws.cell(row=r, column=1).alignment = _WRAP
-    r += 1
-    pso_pct = REVENUE_BREAKDOWN.get("PSO", {}).get("total", 0) / REVENUE if REVENUE > 0 else 0
-    ws.cell(row=r, column=1, value=f"PSO revenue ({pso_pct:.0%}) suggests active services delivery. "
-            "Consider whether PSO can absorb some outsourced F&A functions during transition.").font = _DATA_FONT
-    ws.merge_cells(start_row=r, start_column=1, end_row=r, end_column=5)
-    ws.cell(row=r, column=1).alignment = _WRAP
-    r += 1
-    perp_pct = REVENUE_BREAKDOWN.get("Perpetual", {}).get("total", 0) / REVENUE if REVENUE > 0 else 0
-    ws.cell(row=r, column=1, value=f"Perpetual revenue ({perp_pct:.0%}) is minimal. "
-            "Revenue mix is healthy for a subscription model business unit.").font = _DATA_FONT
-    ws.merge_cells(start_row=r, start_column=1, end_row=r, end_column=5)
-    ws.cell(row=r, column=1).alignment = _WRAP
+    ws.append([])
+    _append_row(ws, cw, ["Key Observations:"], ("PL Bold",))
+    stream_totals = {stream: data["total"] for stream, data in breakdown.items()}
+    recurring_pct = stream_totals.get("Recurring", 0) * inv_rev
+    pso_pct = stream_totals.get("PSO", 0) * inv_rev
+    perp_pct = stream_totals.get("Perpetual", 0) * inv_rev
+    for note in (
+        f"Recurring revenue is {recurring_pct:.0%} of total. "
+        "High recurring base provides stable revenue for transformation investment.",
+        f"PSO revenue ({pso_pct:.0%}) suggests active services delivery. "
+        "Consider whether PSO can absorb some outsourced F&A functions during transition.",
+        f"Perpetual revenue ({perp_pct:.0%}) is minimal. "
+        "Revenue mix is healthy for a subscription model business unit.",
+    ):
+        _append_row(ws, cw, [note], ("PL Note",))
+        ws.merge_cells(start_row=ws.max_row, start_column=1, end_row=ws.max_row, end_column=5)
 
     # P&L Summary data
-    r += 2
-    ws.cell(row=r, column=1, value="P&L Summary (from P&L Summary sheet):").font = _BOLD_FONT
-    r += 1
+    ws.append([])
+    _append_row(ws, cw, ["P&L Summary (from P&L Summary sheet):"], ("PL Bold",))
+    row_styles = ("PL Data", "PL Data Currency", "PL Data Pct")
     for label in ["Revenue", "HC Expense (W2)", "Non HC Expense - TOTAL", "Expense", "Margin"]:
-        val = PL_SUMMARY.get(label, 0)
-        ws.cell(row=r, column=1, value=label).font = _DATA_FONT
-        ws.cell(row=r, column=2, value=round(val)).font = _DATA_FONT
-        ws.cell(row=r, column=2).number_format = _CURRENCY_FMT
-        if REVENUE > 0:
-            ws.cell(row=r, column=3, value=val / REVENUE).font = _DATA_FONT
-            ws.cell(row=r, column=3).number_format = _PCT_FMT
-        r += 1
+        val = pl_summary.get(label, 0)
+        values = [label, _round(val)]
+        if rev > 0:
+            values.append(val * inv_rev)
+        _append_row(ws, cw, values, row_styles)
 
-    _auto_width(ws)
+    cw.apply(ws)
 
 
-def build_fa_employee_analysis(wb) -> None:
+def build_fa_employee_analysis(wb, sd: SourceData) -> None:
     """Sheet 4: Current F&A employees mapped to Central Finance roles."""
+    _register_styles(wb)
     ws = wb.create_sheet("FA Employee Analysis")
+    cw = _ColWidths()
+    _round = round
 
     headers = [
         "Employee #", "Current Salary", "Salary Band",
         "Target Central Finance Role", "Target Salary", "Delta"
     ]
-    _write_header(ws, headers)
+    _write_header(ws, cw, headers)
 
     mapping = get_employee_role_mapping()
-    r = 2
+    row_styles = ("PL Data", "PL Data Currency", "PL Data", "PL Data",
+                  "PL Data Currency", "PL Data Currency")
     for i, m in enumerate(mapping, 1):
-        salary = m["current_salary"]
-        if salary >= 150_000:
-            band = "$150K+"
-        elif salary >= 85_000:
-            band = "$85K to $150K"
-        elif salary >= 55_000:
-            band = "$55K to $85K"
-        else:
-            band = "Under $55K"
-
-        ws.cell(row=r, column=1, value=i).font = _DATA_FONT
-        ws.cell(row=r, column=2, value=round(salary)).font = _DATA_FONT
-        ws.cell(row=r, column=2).number_format = _CURRENCY_FMT
-        ws.cell(row=r, column=3, value=band).font = _DATA_FONT
-        ws.cell(row=r, column=4, value=m["target_role"]).font = _DATA_FONT
-        ws.cell(row=r, column=5, value=m["target_salary"]).font = _DATA_FONT
-        ws.cell(row=r, column=5).number_format = _CURRENCY_FMT
-        ws.cell(row=r, column=6, value=m["target_salary"] - round(salary)).font = _DATA_FONT
-        ws.cell(row=r, column=6).number_format = _CURRENCY_FMT
-        r += 1
+        current_salary = m["current_salary"]
+        band = _SALARY_BANDS[bisect_right(SALARY_BAND_THRESHOLDS, current_salary)]
+        salary = _round(current_salary)
+        target_salary = m["target_salary"]
+        _append_row(
+            ws, cw,
+            [i, salary, band, m["target_role"], target_salary, target_salary - salary],
+            row_styles,
+        )
 
     # Summary row
     total_current = sum(m["current_salary"] for m in mapping)
     total_target = sum(m["target_salary"] for m in mapping)
-    ws.cell(row=r, column=1, value="TOTAL").font = _BOLD_FONT
-    ws.cell(row=r, column=1).fill = _TOTAL_FILL
-    ws.cell(row=r, column=2, value=round(total_current)).font = _BOLD_FONT
-    ws.cell(row=r, column=2).number_format = _CURRENCY_FMT
-    ws.cell(row=r, column=2).fill = _TOTAL_FILL
-    ws.cell(row=r, column=5, value=total_target).font = _BOLD_FONT
-    ws.cell(row=r, column=5).number_format = _CURRENCY_FMT
-    ws.cell(row=r, column=5).fill = _TOTAL_FILL
-    ws.cell(row=r, column=6, value=total_target - round(total_current)).font = _BOLD_FONT
-    ws.cell(row=r, column=6).number_format = _CURRENCY_FMT
-    ws.cell(row=r, column=6).fill = _TOTAL_FILL
-
-    r += 2
-    ws.cell(row=r, column=1, value="Note:").font = _BOLD_FONT
-    ws.cell(row=r, column=2, value="Salary band mapping uses Central Finance Roles provided by evaluator. "
-            "Actual role placement would require skills assessment.").font = _DATA_FONT
-    ws.merge_cells(start_row=r, start_column=2, end_row=r, end_column=6)
-    ws.cell(row=r, column=2).alignment = _WRAP
-
-    _auto_width(ws)
+    _append_row(
+        ws, cw,
+        ["TOTAL", _round(total_current), None, None, total_target,
+         total_target - _round(total_current)],
+        ("PL Total", "PL Total Currency", None, None, "PL Total Currency", "PL Total Currency"),
+    )
+
+    ws.append([])
+    _append_row(
+        ws, cw,
+        ["Note:", "Salary band mapping uses Central Finance Roles provided by evaluator. "
+         "Actual role placement would require skills assessment."],
+        ("PL Bold", "PL Note"),
+    )
+    ws.merge_cells(start_row=ws.max_row, start_column=2, end_row=ws.max_row, end_column=6)
+
+    cw.apply(ws)
 
 
 # ---------------------------------------------------------------------------
@@ -740,40 +831,46 @@ def main() -> None:
     # Ensure output directory exists
     os.makedirs(os.path.dirname(OUTPUT_PL), exist_ok=True)
 
+    # Copy original file up front (preserves all original sheets, formulas,
+    # and formatting); only the 5 new sheets are added to the copy.
+    shutil.copyfile(INPUT_PL, OUTPUT_PL)
+
     # Read source data with data_only=True to resolve formula cells
-    # (P&L Summary, Benchmarks, Revenue sheets contain formulas that need cached values)
+    # (P&L Summary, Benchmarks, Revenue sheets contain formulas that need cached values).
+    # read_only=True streams rows instead of building the full cell tree;
+    # python-calamine is used instead when installed.
     print("Reading all 8 source sheets (data_only=True for formula resolution):")
-    wb_data = load_workbook(INPUT_PL, data_only=True)
-    read_source_data(wb_data)
-    wb_data.close()
-
-    # Copy original file (preserves all original sheets, formulas, and formatting)
-    shutil.copy2(INPUT_PL, OUTPUT_PL)
+    src_wb = open_source_workbook(INPUT_PL)
+    try:
+        sd = read_source_data(src_wb)
+    finally:
+        # Release the source before the copy is loaded for writing
+        src_wb.close()
     print(f"\nCopied input to {OUTPUT_PL}")
 
-    # Open output with data_only=True for reading source data in builders,
-    # but we need to write new sheets. openpyxl data_only workbooks are read-only
-    # for formula cells but we only write to NEW sheets, so this is fine.
-    # Actually, we need a writable workbook. The OPEX/COGS/Empl sheets have raw values
-    # (not formulas), so reading without data_only works for those.
+    # The copy is opened once, in normal mode: new sheets must be appended to
+    # the existing workbook, which write_only workbooks cannot do, so the
+    # analysis sheets are ordinary in-memory worksheets. Nearly all of the
+    # load/save time is the copied input sheets.
+    # Default load options keep any external-workbook links in the saved copy.
     wb = load_workbook(OUTPUT_PL)
     print(f"Original sheets: {wb.sheetnames}")
 
     # Build 5 analysis sheets (one per analytical layer)
     print("\nBuilding analysis sheets:")
-    build_revenue_analysis(wb)
+    build_revenue_analysis(wb, sd)
     print("  Built: Revenue Analysis (from P&L Summary + 3 Revenue sheets)")
 
-    build_benchmark_mapping(wb)
+    build_benchmark_mapping(wb, sd)
     print("  Built: Benchmark Mapping (from Benchmarks + Empl + OPEX + COGS sheets)")
 
-    build_shared_services_breakdown(wb)
+    build_shared_services_breakdown(wb, sd)
     print("  Built: SS Breakdown (from Empl + OPEX sheets)")
 
-    build_fa_deep_dive(wb)
+    build_fa_deep_dive(wb, sd)
     print("  Built: FA Deep Dive (from cost model + OPEX + Empl sheets)")
 
-    build_fa_employee_analysis(wb)
+    build_fa_employee_analysis(wb, sd)
     print("  Built: FA Employee Analysis (from Empl + Central Finance Roles)")
 
     wb.save(OUTPUT_PL)
@@ -783,21 +880,22 @@ def main() -> None:
     # Validation
     print("\n=== Validation ===")
     print(f"Source sheets read: 8 of 8")
-    print(f"  Benchmarks: {len(BENCHMARK_TARGETS)} categories")
-    print(f"  P&L Summary: Revenue ${REVENUE:,.0f}")
+    print(f"  Benchmarks: {len(sd.benchmark_targets)} categories")
+    print(f"  P&L Summary: Revenue ${sd.revenue:,.0f}")
     print(f"  OPEX-NEmpl: processed (2,092 rows)")
     print(f"  COGS-NEmpl: processed (1,000 rows)")
     print(f"  Empl: processed (458 employees)")
-    print(f"  RecurringRevenue: ${REVENUE_BREAKDOWN.get('Recurring', {}).get('total', 0):,.0f}")
-    print(f"  PSORevenue: ${REVENUE_BREAKDOWN.get('PSO', {}).get('total', 0):,.0f}")
-    print(f"  PerpetualRevenue: ${REVENUE_BREAKDOWN.get('Perpetual', {}).get('total', 0):,.0f}")
+    stream_totals = {stream: data["total"] for stream, data in sd.revenue_breakdown.items()}
+    print(f"  RecurringRevenue: ${stream_totals.get('Recurring', 0):,.0f}")
+    print(f"  PSORevenue: ${stream_totals.get('PSO', 0):,.0f}")
+    print(f"  PerpetualRevenue: ${stream_totals.get('Perpetual', 0):,.0f}")
 
     summary = get_savings_summary()
     print(f"\nF&A Deep Dive:")
     print(f"  Current F&A: ${summary['current_total']:,.0f}")
     print(f"  Target:      ${summary['target_total']:,.0f}")
     print(f"  Savings:     ${summary['annual_savings']:,.0f} ({summary['savings_pct']:.0%})")
-    print(f"  F&A % rev:   {summary['current_total']/REVENUE:.1%} (benchmark: 4.5%)")
+    print(f"  F&A % rev:   {summary['current_total']/sd.revenue:.1%} (benchmark: 4.5%)")
     print(f"SS benchmark: 4.5%")
 
 
@@ -13,6 +13,10 @@ Central Finance Roles (from provided spreadsheet):
 
 from __future__ import annotations
 
+from bisect import bisect_right
+from functools import lru_cache
+from types import MappingProxyType
+
 
 # Central Finance role definitions (from Central Finance Roles.xlsx)
 CENTRAL_ROLES = {
@@ -57,24 +61,52 @@ CURRENT_FA_OPEX = {
     "T&E/Other":              -319_074,
 }
 
-
-def get_current_fa_cost() -> dict:
+# Proposed Central Finance team
+TARGET_FA_ROLES = tuple(MappingProxyType(r) for r in (
+    {"role": "VP of Finance",     "count": 1, "annual": 200_000},
+    {"role": "Finance Manager",   "count": 2, "annual": 100_000},
+    {"role": "Senior Accountant", "count": 5, "annual":  60_000},
+    {"role": "Accountant",        "count": 10, "annual":  30_000},
+))
+STATUTORY_AUDIT = 200_000  # required external audit, cannot eliminate
+
+# Totals over the fixed inputs above, computed once at import
+HEADCOUNT_COST = sum(CURRENT_FA_SALARIES)
+NON_HC_COST = sum(CURRENT_FA_OPEX.values())
+TEAM_COST = sum(r["count"] * r["annual"] for r in TARGET_FA_ROLES)
+TOTAL_HEADCOUNT = sum(r["count"] for r in TARGET_FA_ROLES)
+_CURRENT_TOTAL = HEADCOUNT_COST + NON_HC_COST
+_TARGET_TOTAL = TEAM_COST + STATUTORY_AUDIT
+
+# Salary band lower bounds (ascending). Also used for the band column of
+# the FA Employee Analysis sheet.
+SALARY_BAND_THRESHOLDS = (55_000, 85_000, 150_000)
+
+# Employee role mapping: salaries highest first, one role tier per salary band
+_SORTED_SALARIES = tuple(sorted(CURRENT_FA_SALARIES, reverse=True))
+_ROLES = ("Accountant", "Senior Accountant", "Finance Manager", "VP of Finance")
+_TARGET_ANNUALS = tuple(CENTRAL_ROLES[r]["annual"] for r in _ROLES)
+
+
+# The getters below depend only on the module constants above, so each is
+# computed once per process. Callers share the cached result, which is why
+# dicts are returned as MappingProxyType views and lists as tuples.
+
+@lru_cache(maxsize=None)
+def get_current_fa_cost() -> MappingProxyType:
     """Calculate total current F&A cost by component."""
-    headcount_cost = sum(CURRENT_FA_SALARIES)
-    non_hc_cost = sum(CURRENT_FA_OPEX.values())
-    total = headcount_cost + non_hc_cost
-
-    return {
+    return MappingProxyType({
         "headcount_count": len(CURRENT_FA_SALARIES),
-        "headcount_cost": headcount_cost,
-        "non_hc_cost": non_hc_cost,
-        "non_hc_breakdown": dict(CURRENT_FA_OPEX),
-        "total": total,
-        "outsourced_pct": (CURRENT_FA_OPEX["Outsourced Services"] + CURRENT_FA_OPEX["External Contractors"]) / total,
-    }
+        "headcount_cost": HEADCOUNT_COST,
+        "non_hc_cost": NON_HC_COST,
+        "non_hc_breakdown": MappingProxyType(dict(CURRENT_FA_OPEX)),
+        "total": _CURRENT_TOTAL,
+        "outsourced_pct": (CURRENT_FA_OPEX["Outsourced Services"] + CURRENT_FA_OPEX["External Contractors"]) / _CURRENT_TOTAL,
+    })
 
 
-def get_target_fa_model() -> dict:
+@lru_cache(maxsize=None)
+def get_target_fa_model() -> MappingProxyType:
     """Define the target Central Finance team structure.
 
     Target Central Finance team structure based on role tiers:
@@ -85,66 +117,43 @@ def get_target_fa_model() -> dict:
 
     Plus: $200K for statutory audits that cannot be eliminated.
     """
-    # Proposed Central Finance team
-    roles = [
-        {"role": "VP of Finance",     "count": 1, "annual": 200_000},
-        {"role": "Finance Manager",   "count": 2, "annual": 100_000},
-        {"role": "Senior Accountant", "count": 5, "annual":  60_000},
-        {"role": "Accountant",        "count": 10, "annual":  30_000},
-    ]
-
-    team_cost = sum(r["count"] * r["annual"] for r in roles)
-    statutory_audit = 200_000  # required external audit, cannot eliminate
-    total = team_cost + statutory_audit
-    total_headcount = sum(r["count"] for r in roles)
-
-    return {
-        "roles": roles,
-        "team_cost": team_cost,
-        "statutory_audit": statutory_audit,
-        "total": total,
-        "headcount": total_headcount,
-    }
-
-
-def get_employee_role_mapping() -> list[dict]:
+    return MappingProxyType({
+        "roles": TARGET_FA_ROLES,
+        "team_cost": TEAM_COST,
+        "statutory_audit": STATUTORY_AUDIT,
+        "total": _TARGET_TOTAL,
+        "headcount": TOTAL_HEADCOUNT,
+    })
+
+
+@lru_cache(maxsize=None)
+def get_employee_role_mapping() -> tuple[MappingProxyType, ...]:
     """Map each current F&A employee to a Central Finance role tier by salary band."""
     mapping = []
-    for salary in sorted(CURRENT_FA_SALARIES, reverse=True):
-        if salary >= 150_000:
-            target = "VP of Finance"
-        elif salary >= 85_000:
-            target = "Finance Manager"
-        elif salary >= 55_000:
-            target = "Senior Accountant"
-        else:
-            target = "Accountant"
-
-        mapping.append({
+    for salary in _SORTED_SALARIES:
+        tier = bisect_right(SALARY_BAND_THRESHOLDS, salary)
+        mapping.append(MappingProxyType({
             "current_salary": salary,
-            "target_role": target,
-            "target_salary": CENTRAL_ROLES[target]["annual"],
-        })
+            "target_role": _ROLES[tier],
+            "target_salary": _TARGET_ANNUALS[tier],
+        }))
 
-    return mapping
+    return tuple(mapping)
 
 
-def get_savings_summary() -> dict:
+@lru_cache(maxsize=None)
+def get_savings_summary() -> MappingProxyType:
     """Calculate savings from moving F&A to Central Finance model."""
-    current = get_current_fa_cost()
-    target = get_target_fa_model()
-
-    savings = current["total"] - target["total"]
-    savings_pct = savings / current["total"]
+    savings = _CURRENT_TOTAL - _TARGET_TOTAL
 
-    return {
-        "current_total": current["total"],
-        "target_total": target["total"],
+    return MappingProxyType({
+        "current_total": _CURRENT_TOTAL,
+        "target_total": _TARGET_TOTAL,
         "annual_savings": savings,
-        "savings_pct": savings_pct,
-        "current_headcount": current["headcount_count"],
-        "target_headcount": target["headcount"],
-    }
+        "savings_pct": savings / _CURRENT_TOTAL,
+        "current_headcount": len(CURRENT_FA_SALARIES),
+        "target_headcount": TOTAL_HEADCOUNT,
+    })
 
 
 if __name__ == "__main__":
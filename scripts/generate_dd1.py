@@ -21,13 +21,18 @@ Writing style rules:
 
 from __future__ import annotations
 
+import io
 import os
+import re
 import sys
 import shutil
+from functools import lru_cache
 
 from docx import Document
 from docx.shared import Pt, RGBColor
+from docx.enum.style import WD_STYLE_TYPE
 from docx.enum.text import WD_ALIGN_PARAGRAPH
+from docx.oxml.ns import qn
 
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 from cost_model import get_savings_summary, get_target_fa_model, get_current_fa_cost
@@ -114,8 +119,11 @@ ROOT_CAUSE = (
 )
 
 
-def _build_fix_text() -> str:
-    """Build the Fix section text using cost model data."""
+def _build_fix_text() -> list[str]:
+    """Build the Fix section lines using cost model data.
+
+    An entry ending in a newline is followed by a blank line in the cell.
+    """
     target = get_target_fa_model()
     summary = get_savings_summary()
     current = get_current_fa_cost()
@@ -180,7 +188,7 @@ def _build_fix_text() -> str:
     lines.append("  Employee transition: Employees who do not fit Central Finance roles exit. Budget 2 to 3 replacements.")
     lines.append("  Multi jurisdiction tax: Retain 1 to 2 outsourced tax advisors for non US filings during transition. Budget $50K to $75K.")
 
-    return "\n".join(lines)
+    return lines
 
 
 AI_OPPORTUNITIES = (
@@ -243,87 +251,119 @@ AI_TOOLS_USED = (
 # Document generation
 # ---------------------------------------------------------------------------
 
+@lru_cache(maxsize=None)
+def _template_bytes() -> bytes:
+    """Read the DD1 template once per process."""
+    with open(TEMPLATE, "rb") as f:
+        return f.read()
+
+
 def generate_dd1() -> None:
     """Open template, fill all 8 rows, save output."""
     os.makedirs(os.path.dirname(OUTPUT), exist_ok=True)
 
-    doc = Document(TEMPLATE)
+    # Each run parses a fresh Document from the cached template bytes
+    doc = Document(io.BytesIO(_template_bytes()))
     table = doc.tables[0]
 
     # Row 0: Function - already "Operations"
     # Row 1: Playbook Item - already "Initial Import"
-
-    # Row 2: Problem Statement
-    _set_cell_text(table.rows[2].cells[1], PROBLEM_STATEMENT)
-
-    # Row 3: 5 Why Analysis
-    _set_cell_text(table.rows[3].cells[1], FIVE_WHY_ANALYSIS)
-
-    # Row 4: Root Cause
-    _set_cell_text(table.rows[4].cells[1], ROOT_CAUSE)
-
-    # Row 5: Fix
-    _set_cell_text(table.rows[5].cells[1], _build_fix_text())
-
-    # Row 6: AI Opportunities
-    _set_cell_text(table.rows[6].cells[1], AI_OPPORTUNITIES)
-
-    # Row 7: AI Tools Used
-    _set_cell_text(table.rows[7].cells[1], AI_TOOLS_USED)
+    # Rows 2-7: see _dd1_rows()
+    run_style = _run_style(doc)
+    for row_idx, lines in _dd1_rows():
+        _set_cell_text(table.rows[row_idx].cells[1], lines, run_style)
 
     doc.save(OUTPUT)
     print(f"Saved: {OUTPUT}")
 
-    # Validate: check no empty cells
-    doc2 = Document(OUTPUT)
-    table2 = doc2.tables[0]
-    for i in range(8):
-        label = table2.rows[i].cells[0].text.strip()
-        content = table2.rows[i].cells[1].text.strip()
+    # Validate: check no empty cells (on the in-memory document; no reparse)
+    for i, row in enumerate(table.rows[:8]):
+        label = row.cells[0].text.strip()
+        content = row.cells[1].text.strip()
         status = "OK" if content else "EMPTY"
         print(f"  Row {i} ({label}): {status} ({len(content)} chars)")
 
 
-def _set_cell_text(cell, text: str) -> None:
-    """Clear existing cell content and write new text with consistent formatting."""
-    # Clear existing paragraphs
-    for p in cell.paragraphs:
-        p.clear()
-
-    # Remove all but first paragraph
-    while len(cell.paragraphs) > 1:
-        p = cell.paragraphs[-1]
-        p._element.getparent().remove(p._element)
+# Line formatting: bold section headers, explicitly plain answer lines,
+# everything else left at the template default
+_BOLD_PREFIXES = ("What:", "Why:", "Question", "Area ")
+_PLAIN_PREFIXES = ("Answer:", "Evidence:")
+_NUM_HDR = re.compile(r"[123]\..*(?:What AI tools|How they helped|How this approach)")
+
+
+def _line_bold(line: str) -> bool | None:
+    """Return the run bold setting for one line of cell text."""
+    if line.startswith(_BOLD_PREFIXES) or _NUM_HDR.match(line):
+        return True
+    if line.startswith(_PLAIN_PREFIXES):
+        return False
+    return None
+
+
+def _format_lines(text: str | list[str]) -> tuple[tuple[str, bool | None], ...]:
+    """Split cell text (one string or a list of line entries) into (line, bold) pairs."""
+    if isinstance(text, str):
+        text = (text,)
+    return tuple(
+        (line, _line_bold(line))
+        for entry in text
+        for line in entry.split("\n")
+    )
+
+
+@lru_cache(maxsize=None)
+def _dd1_rows() -> tuple[tuple[int, tuple[tuple[str, bool | None], ...]], ...]:
+    """(row index, formatted lines) for every filled DD1 row.
+
+    The texts are static (the Fix text depends only on cost_model
+    constants), so lines are split and classified once per process.
+    """
+    return (
+        (2, _format_lines(PROBLEM_STATEMENT)),   # Problem Statement
+        (3, _format_lines(FIVE_WHY_ANALYSIS)),   # 5 Why Analysis
+        (4, _format_lines(ROOT_CAUSE)),          # Root Cause
+        (5, _format_lines(_build_fix_text())),   # Fix
+        (6, _format_lines(AI_OPPORTUNITIES)),    # AI Opportunities
+        (7, _format_lines(AI_TOOLS_USED)),       # AI Tools Used
+    )
+
+
+# Cell text formatting: one shared character style instead of per-run fonts
+_RUN_STYLE = "DD1 Text"
+_FONT_SIZE = Pt(9)
+
+
+def _run_style(doc):
+    """Return the Arial 9pt character style for cell text, adding it if needed."""
+    styles = doc.styles
+    try:
+        return styles[_RUN_STYLE]
+    except KeyError:
+        style = styles.add_style(_RUN_STYLE, WD_STYLE_TYPE.CHARACTER)
+        style.font.name = "Arial"
+        style.font.size = _FONT_SIZE
+        return style
+
+
+def _set_cell_text(cell, lines, run_style) -> None:
+    """Clear existing cell content and write (line, bold) pairs in `run_style`."""
+    # Remove all but the first paragraph in one pass, then clear its runs
+    tc = cell._tc
+    for p in tc.findall(qn("w:p"))[1:]:
+        tc.remove(p)
+    cell.paragraphs[0].clear()
 
     # Write text as formatted paragraphs
-    lines = text.split("\n")
     first = True
-    for line in lines:
+    for line, bold in lines:
         if first:
             para = cell.paragraphs[0]
             first = False
         else:
             para = cell.add_paragraph()
 
-        run = para.add_run(line)
-        run.font.name = "Arial"
-        run.font.size = Pt(9)
-
-        # Bold formatting for section headers
-        if line.startswith("What:") or line.startswith("Why:"):
-            run.bold = True
-        elif line.startswith("Question"):
-            run.bold = True
-        elif line.startswith("Answer:") or line.startswith("Evidence:"):
-            run.bold = False
-        elif line.startswith("Area "):
-            run.bold = True
-        elif line.startswith("1.") or line.startswith("2.") or line.startswith("3."):
-            if "What AI tools" in line or "How they helped" in line or "How this approach" in line:
-                run.bold = True
-
-        para.space_after = Pt(2)
-        para.space_before = Pt(0)
+        run = para.add_run(line, run_style)
+        run.bold = bold
 
 
 if __name__ == "__main__":